@@ -0,0 +1 @@
+"""NSW property development analysis backend."""
@@ -0,0 +1 @@
+"""Constraint and yield analysis engines."""
@@ -0,0 +1,20 @@
+"""Shared mapping from severity scores to rating labels."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+# Lower bounds of each label band: 0 None, 1-3 Low, 4-7 Medium, 8-12 High,
+# 13+ Red-Flag. searchsorted(side="right") makes the lookup branchless.
+_BOUNDS = np.array([1, 4, 8, 13], dtype=np.int32)
+_LABELS = np.array(["None", "Low", "Medium", "High", "Red-Flag"])
+
+
+def score_to_rating(score: int) -> str:
+    """Map one severity score to its rating label."""
+    return str(_LABELS[int(np.searchsorted(_BOUNDS, score, side="right"))])
+
+
+def scores_to_ratings(scores: Sequence[int]) -> List[str]:
+    """Map a batch of severity scores to rating labels in one vector op."""
+    return _LABELS[np.searchsorted(_BOUNDS, np.asarray(scores, dtype=np.int32), side="right")].tolist()
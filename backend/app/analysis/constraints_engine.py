@@ -0,0 +1,135 @@
+"""Parcel constraint evaluation and severity scoring."""
+
+import json
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+from cachetools import LRUCache
+from shapely.geometry import Polygon, shape
+from shapely.strtree import STRtree
+
+from backend.app.analysis._rating import score_to_rating
+from backend.app.config import settings
+
+# Order must match _CONSTRAINT_KEYS below.
+_WEIGHTS = np.array(
+    [
+        settings.BUSHFIRE_WEIGHT,
+        settings.FLOOD_WEIGHT,
+        settings.HERITAGE_WEIGHT,
+        settings.GEOTECH_WEIGHT,
+        settings.BIODIVERSITY_WEIGHT,
+        settings.MISC_WEIGHT,
+    ],
+    dtype=np.int32,
+)
+
+_CONSTRAINT_KEYS = (
+    "bushfire_prone",
+    "flood_prone",
+    "heritage_item",
+    "geotech_risk",
+    "biodiversity_value",
+    "misc_constraint",
+)
+
+# Cached NSW overlay extracts (GeoJSON in analysis CRS), indexed per layer
+# with an STRtree so per-parcel evaluation is O(log N + hits) instead of a
+# linear scan over every overlay feature.
+_OVERLAY_DIR = Path(__file__).resolve().parents[1] / "data" / "overlays"
+_OVERLAY_KEYS = {
+    "bushfire": "bushfire_prone",
+    "flood": "flood_prone",
+    "heritage": "heritage_item",
+    "geotech": "geotech_risk",
+    "biodiversity": "biodiversity_value",
+}
+_OVERLAY_INDEXES: Dict[str, STRtree] = {}
+
+
+def load_overlays(overlay_dir: Path = _OVERLAY_DIR) -> None:
+    """Build an STRtree per overlay layer from cached NSW GeoJSON extracts.
+
+    Missing directory or layers are tolerated: evaluation falls back to the
+    placeholder flags for any layer without an index.
+    """
+    _OVERLAY_INDEXES.clear()
+    if not overlay_dir.is_dir():
+        return
+    for path in sorted(overlay_dir.glob("*.geojson")):
+        with path.open() as fh:
+            collection = json.load(fh)
+        geoms = [shape(feature["geometry"]) for feature in collection.get("features", [])]
+        if geoms:
+            _OVERLAY_INDEXES[path.stem] = STRtree(geoms)
+
+
+# Constraint overlays change on LEP amendment timescales, so per-cell results
+# can be cached aggressively. Keys quantise the parcel bounding box to a 10 cm
+# grid in MGA coordinates; nearby parcels sharing a cell share the lookup.
+_CONSTRAINT_CACHE: LRUCache = LRUCache(maxsize=100_000)
+
+
+def _cell_key(polygon: Polygon) -> Tuple[float, float, float, float]:
+    minx, miny, maxx, maxy = polygon.bounds
+    return (round(minx, 1), round(miny, 1), round(maxx, 1), round(maxy, 1))
+
+
+def evaluate_constraints(polygon: Polygon) -> Dict[str, bool]:
+    """Evaluate NSW planning constraints affecting the parcel.
+
+    Results are memoised by the quantised bounding-box cell, since the
+    overlay intersections this will perform against NSW layers dominate
+    latency and are stable for a given location.
+    """
+    key = _cell_key(polygon)
+    cached = _CONSTRAINT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _evaluate_constraints_uncached(polygon)
+    _CONSTRAINT_CACHE[key] = result
+    return result
+
+
+def _evaluate_constraints_uncached(polygon: Polygon) -> Dict[str, bool]:
+    """Intersect the parcel against whatever overlay indexes are loaded.
+
+    STRtree.query with predicate="intersects" does a bbox prefilter through
+    the tree followed by precise GEOS tests on the candidates only. Layers
+    without a cached extract default to False until the NSW spatial
+    services integration lands.
+    """
+    result = {
+        "bushfire_prone": False,
+        "flood_prone": False,
+        "heritage_item": False,
+        "geotech_risk": False,
+        "biodiversity_value": False,
+        "misc_constraint": False,
+    }
+    for name, tree in _OVERLAY_INDEXES.items():
+        key = _OVERLAY_KEYS.get(name, "misc_constraint")
+        hits = tree.query(polygon, predicate="intersects")
+        result[key] = result[key] or bool(len(hits))
+    return result
+
+
+def compute_constraint_severity(constraints: Dict[str, bool]) -> Dict[str, object]:
+    """Score constraint severity as a weighted sum and map it to a rating.
+
+    Severities and weights are kept as two small int32 vectors so the score
+    is one dot product rather than six scalar multiply-adds with separate
+    attribute loads, and the rating ladder is a branchless searchsorted
+    lookup.
+    """
+    severities = np.empty(len(_CONSTRAINT_KEYS), dtype=np.int32)
+    for i, key in enumerate(_CONSTRAINT_KEYS):
+        severities[i] = 1 if constraints.get(key) else 0
+    total_score = int(_WEIGHTS @ severities)
+    return {"score": total_score, "rating": score_to_rating(total_score)}
+
+
+def compute_risk_rating(total_score: int) -> str:
+    """Map a raw severity score to a rating label."""
+    return score_to_rating(total_score)
@@ -0,0 +1,119 @@
+"""Development yield estimation for analysed parcels."""
+
+from typing import Dict, Optional
+
+from backend.app.config import settings
+
+# Constraint bit positions, packed once per call so the typology rules can be
+# checked against a single int instead of re-fetching dict flags per rule.
+HERITAGE_BIT = 1 << 0
+BUSHFIRE_BIT = 1 << 1
+FLOOD_BIT = 1 << 2
+
+# (typology, display label, min lot area sqm, min frontage m, blocked-by
+# mask, fixed dwellings) evaluated in priority order; a None dwelling count
+# means derive from GFA. Display labels are precomputed so the note pass
+# does no per-call string munging.
+_RULES = (
+    (
+        "multi_dwelling",
+        "multi dwelling",
+        settings.MIN_LOT_AREA_MULTI_DWELLING_SQM,
+        settings.MIN_FRONTAGE_MULTI_DWELLING_M,
+        HERITAGE_BIT | FLOOD_BIT,
+        None,
+    ),
+    (
+        "terraces",
+        "terraces",
+        settings.MIN_LOT_AREA_TERRACE_SQM,
+        settings.MIN_FRONTAGE_TERRACE_M,
+        HERITAGE_BIT | FLOOD_BIT,
+        None,
+    ),
+    (
+        "dual_occupancy",
+        "dual occupancy",
+        settings.MIN_LOT_AREA_DUAL_OCC_SQM,
+        settings.MIN_FRONTAGE_DUAL_OCC_M,
+        HERITAGE_BIT,
+        2,
+    ),
+    (
+        "secondary_dwelling",
+        "secondary dwelling",
+        settings.MIN_LOT_AREA_SECONDARY_DWELLING_SQM,
+        0.0,
+        HERITAGE_BIT,
+        2,
+    ),
+    ("single_dwelling", "single dwelling", 0.0, 0.0, 0, 1),
+)
+
+
+def pack_constraint_flags(constraints: Dict[str, bool]) -> int:
+    """Pack the yield-relevant constraint booleans into one bitmask."""
+    return (
+        (HERITAGE_BIT if constraints.get("heritage_item") else 0)
+        | (BUSHFIRE_BIT if constraints.get("bushfire_prone") else 0)
+        | (FLOOD_BIT if constraints.get("flood_prone") else 0)
+    )
+
+
+_SUMMARY_TEMPLATE = "Primary typology: {typology} ({dwellings} dwellings, ~{gfa:.0f} sqm GFA)."
+_FLAG_NOTES = (
+    (HERITAGE_BIT, "Heritage listing limits redevelopment; seek heritage advice."),
+    (BUSHFIRE_BIT, "Bushfire prone land; BAL assessment required."),
+    (FLOOD_BIT, "Flood control lot; flood study required."),
+)
+
+# Precompiled note template per flag bitmask: the per-call work collapses to
+# one dict lookup plus a single .format(), with no per-flag branching or
+# list joining on the hot path.
+_NOTE_TEMPLATES = {
+    flags: " ".join(
+        [_SUMMARY_TEMPLATE] + [note for bit, note in _FLAG_NOTES if flags & bit]
+    )
+    for flags in range(1 << len(_FLAG_NOTES))
+}
+
+
+def generate_yield_notes(typology: str, dwellings: int, flags: int, max_gfa_sqm: float) -> str:
+    """Assemble advisory notes for the selected typology and constraints."""
+    return _NOTE_TEMPLATES[flags].format(
+        typology=typology.replace("_", " "), dwellings=dwellings, gfa=max_gfa_sqm
+    )
+
+
+def compute_yield(
+    geometry_data: Dict,
+    constraints: Dict[str, bool],
+    lep_controls: Optional[Dict] = None,
+) -> Dict:
+    """Estimate the best-fit typology and dwelling yield for the parcel.
+
+    Single fused pass: constraint booleans are packed into a bitmask once,
+    the GFA-derived unit count is computed once, the note template for this
+    flag combination is looked up once, and the rules table is then walked
+    with local-variable comparisons only — feasibility, dwelling count and
+    notes all resolve at the first matching rule.
+    """
+    area = geometry_data["area_sqm"]
+    frontage = geometry_data["frontage_m"]
+    controls = lep_controls or {}
+    fsr = controls.get("fsr") or settings.DEFAULT_FSR
+    max_gfa_sqm = area * fsr
+    estimated_units = int(max_gfa_sqm // settings.AVERAGE_UNIT_SIZE_SQM)
+    flags = pack_constraint_flags(constraints)
+    template = _NOTE_TEMPLATES[flags]
+
+    for typology, label, min_area, min_frontage, blocked_mask, fixed_dwellings in _RULES:
+        if area >= min_area and frontage >= min_frontage and not (flags & blocked_mask):
+            dwellings = fixed_dwellings if fixed_dwellings is not None else max(1, estimated_units)
+            return {
+                "primary_typology": typology,
+                "estimated_dwellings": dwellings,
+                "max_gfa_sqm": max_gfa_sqm,
+                "notes": template.format(typology=label, dwellings=dwellings, gfa=max_gfa_sqm),
+            }
+    raise AssertionError("typology rules table must end in an unconditional fallback")
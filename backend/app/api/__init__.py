@@ -0,0 +1 @@
+"""HTTP API layer."""
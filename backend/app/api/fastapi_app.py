@@ -0,0 +1,122 @@
+"""FastAPI application exposing the parcel analysis pipeline."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from backend.app.analysis.constraints_engine import load_overlays
+from backend.app.pipeline.runner import analyse_parcel_cached, analyse_parcels
+from backend.app.services._client import aclose_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the NSW overlay STRtrees before the first request.
+
+    Building the indexes in lifespan rather than lazily on first use keeps
+    first-request latency flat and runs the load off the request path. On
+    shutdown the shared outbound HTTP client is closed so pooled
+    connections to the NSW services are released cleanly.
+    """
+    await asyncio.to_thread(load_overlays)
+    yield
+    await aclose_client()
+
+
+# Analysis endpoints live on a router so the canonical service app
+# (backend.app.main) can mount them alongside its own routes; the
+# standalone app below keeps existing deployments working.
+router = APIRouter()
+
+
+class ParcelInput(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"address": "10 Sample Street, Gosford NSW"}}
+    )
+
+    address: Optional[str] = None
+    lot_dp: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class ParcelAnalysisResponse(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"result": {"parcel": {}, "geometry": {}}}}
+    )
+
+    result: Dict[str, Any]
+
+
+# The analysis result is an arbitrary-shaped dict already built by the
+# pipeline; routing it back through Pydantic would revalidate every nested
+# value for no benefit, so the routes return ORJSONResponse directly and
+# document the shape via the openapi examples.
+_ANALYSIS_RESPONSES = {
+    200: {
+        "content": {
+            "application/json": {
+                "example": {"result": {"parcel": {}, "geometry": {}, "yield": {}}}
+            }
+        }
+    }
+}
+
+
+@router.post("/analyse_parcel", response_model=None, responses=_ANALYSIS_RESPONSES)
+async def analyse_parcel_endpoint(input_data: ParcelInput) -> ORJSONResponse:
+    result = await asyncio.to_thread(analyse_parcel_cached, input_data.model_dump())
+    return ORJSONResponse({"result": result})
+
+
+@router.post("/analyse_parcels", response_model=None, responses=_ANALYSIS_RESPONSES)
+async def analyse_parcels_endpoint(items: List[ParcelInput]) -> ORJSONResponse:
+    """Analyse many parcels in one request.
+
+    The whole batch runs through the vectorised pipeline in one worker
+    thread; geometry for all parcels is derived with array ops rather than
+    per-parcel Python, which beats fanning individual analyses out to the
+    thread pool.
+    """
+    results = await asyncio.to_thread(
+        analyse_parcels, [item.model_dump() for item in items]
+    )
+    return ORJSONResponse([{"result": result} for result in results])
+
+
+app = FastAPI(
+    title="Property Development Analysis API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.include_router(router)
+
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+
+    try:
+        import uvloop  # noqa: F401
+
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "auto", "auto"
+
+    # Note: the analyse_parcel LRU and overlay STRtrees are process-local;
+    # each worker warms its own copies via the lifespan handler.
+    uvicorn.run(
+        "backend.app.api.fastapi_app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop=loop,
+        http=http,
+        log_level="warning",
+    )
@@ -0,0 +1,74 @@
+"""Backend configuration: a single frozen settings module.
+
+Thresholds live on one frozen, slotted dataclass bound at import time;
+individual values can be overridden through environment variables of the
+same name (coerced to the field type). Hot paths should import ``settings``
+directly rather than calling :func:`get_settings` per invocation.
+"""
+
+import os
+from dataclasses import dataclass, fields
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Tunable thresholds for the parcel analysis pipeline."""
+
+    # Coordinate reference systems
+    ANALYSIS_CRS: str = "EPSG:28356"  # MGA Zone 56
+    OUTPUT_CRS: str = "EPSG:4326"
+
+    # Constraint severity weights
+    BUSHFIRE_WEIGHT: int = 3
+    FLOOD_WEIGHT: int = 3
+    HERITAGE_WEIGHT: int = 4
+    GEOTECH_WEIGHT: int = 2
+    BIODIVERSITY_WEIGHT: int = 2
+    MISC_WEIGHT: int = 1
+
+    # LEP / typology thresholds (NSW low-rise housing diversity defaults)
+    MIN_LOT_AREA_DUAL_OCC_SQM: float = 450.0
+    MIN_FRONTAGE_DUAL_OCC_M: float = 12.0
+    MIN_LOT_AREA_MULTI_DWELLING_SQM: float = 600.0
+    MIN_FRONTAGE_MULTI_DWELLING_M: float = 15.0
+    MIN_LOT_AREA_TERRACE_SQM: float = 600.0
+    MIN_FRONTAGE_TERRACE_M: float = 18.0
+    MIN_LOT_AREA_SECONDARY_DWELLING_SQM: float = 450.0
+
+    # Default development standards when no LEP layer answers
+    DEFAULT_FSR: float = 0.5
+    DEFAULT_HEIGHT_LIMIT_M: float = 8.5
+    DEFAULT_MIN_LOT_SIZE_SQM: float = 450.0
+    AVERAGE_UNIT_SIZE_SQM: float = 120.0
+
+    # Setbacks
+    FRONT_SETBACK_M: float = 6.0
+    REAR_SETBACK_M: float = 6.0
+    SIDE_SETBACK_M: float = 0.9
+
+    # Slope / DEM sampling
+    DEM_GRID_SPACING_M: float = 2.0
+    MAX_SLOPE_CDC_PERCENT: float = 20.0
+
+
+def _settings_from_env() -> Settings:
+    overrides = {}
+    for field in fields(Settings):
+        raw = os.environ.get(field.name)
+        if raw is None:
+            continue
+        if isinstance(field.default, int):
+            overrides[field.name] = int(raw)
+        elif isinstance(field.default, float):
+            overrides[field.name] = float(raw)
+        else:
+            overrides[field.name] = raw
+    return Settings(**overrides)
+
+
+settings = _settings_from_env()
+
+
+def get_settings() -> Settings:
+    """Return the module-level settings singleton."""
+    return settings
@@ -0,0 +1,35 @@
+"""Parcel geometry helpers (centroids, boundaries, slope)."""
+
+from dataclasses import dataclass
+
+import numpy as np
+from shapely.geometry import Polygon
+
+
+@dataclass(slots=True)
+class ParcelGeom:
+    """Precomputed parcel geometry in a plain ndarray/float layout.
+
+    Built once per parcel so downstream engines read cached arrays and
+    scalars instead of re-entering GEOS through shapely attribute wrappers
+    on every access.
+    """
+
+    polygon: Polygon
+    coords_xy: np.ndarray
+    centroid_xy: np.ndarray
+    area: float
+    perimeter: float
+    bounds: np.ndarray
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon) -> "ParcelGeom":
+        centroid = polygon.centroid
+        return cls(
+            polygon=polygon,
+            coords_xy=np.asarray(polygon.exterior.coords, dtype=np.float64),
+            centroid_xy=np.array([centroid.x, centroid.y], dtype=np.float64),
+            area=polygon.area,
+            perimeter=polygon.length,
+            bounds=np.asarray(polygon.bounds, dtype=np.float64),
+        )
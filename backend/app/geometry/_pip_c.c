@@ -0,0 +1,38 @@
+/* Ray-crossing point-in-ring mask.
+ *
+ * Optional C companion to the Numba kernel in _kernels.py, for deploy
+ * targets that cannot afford the JIT compile on first call. Build with
+ * backend/scripts/build_pip_ext.sh; _kernels.py loads the resulting
+ * shared library via ctypes and falls back to shapely when it is absent.
+ *
+ * Coordinates are double precision; the ring is a closed exterior ring
+ * laid out as m interleaved (x, y) pairs. The output mask is one uint8_t
+ * per query point (1 inside, 0 outside or on a crossing edge).
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+void pip_mask(const double *xs, const double *ys, size_t n,
+              const double *ring, size_t m, uint8_t *out)
+{
+    for (size_t k = 0; k < n; k++) {
+        const double x = xs[k];
+        const double y = ys[k];
+        int inside = 0;
+        size_t j = m - 1;
+        for (size_t i = 0; i < m; i++) {
+            const double yi = ring[2 * i + 1];
+            const double yj = ring[2 * j + 1];
+            if ((yi > y) != (yj > y)) {
+                const double xi = ring[2 * i];
+                const double xj = ring[2 * j];
+                const double x_cross = xj + (xi - xj) * (y - yj) / (yi - yj);
+                if (x < x_cross)
+                    inside = !inside;
+            }
+            j = i;
+        }
+        out[k] = (uint8_t)inside;
+    }
+}
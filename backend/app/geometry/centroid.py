@@ -0,0 +1,61 @@
+"""Parcel centroid computation with CRS reprojection."""
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+import shapely
+from pyproj import Transformer
+from shapely.geometry import Polygon
+
+WGS84 = "EPSG:4326"
+
+
+@lru_cache(maxsize=16)
+def _get_transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Return a transformer for the given CRS pair, reusing prior instances.
+
+    Transformer construction parses the PROJ database and dominates runtime
+    for small polygons, so instances are cached per (src, dst) pair.
+    Transformer.transform() is thread-safe, making the shared instance safe
+    under async workers.
+    """
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def compute_centroid_xy(x: float, y: float, analysis_crs: str = "EPSG:28356") -> Tuple[float, float]:
+    """Reproject an already-computed centroid to (latitude, longitude).
+
+    Used by callers that hold a ParcelGeom with the centroid precomputed,
+    avoiding a redundant GEOS centroid call.
+    """
+    transformer = _get_transformer(analysis_crs, WGS84)
+    lon, lat = transformer.transform(x, y)
+    return lat, lon
+
+
+def compute_centroid(polygon: Polygon, analysis_crs: str = "EPSG:28356") -> Tuple[float, float]:
+    """Return the parcel centroid as (latitude, longitude) in WGS84.
+
+    ``analysis_crs`` is the projected CRS the parcel coordinates are in
+    (MGA Zone 56 for most of eastern NSW).
+    """
+    centroid = polygon.centroid
+    return compute_centroid_xy(centroid.x, centroid.y, analysis_crs)
+
+
+def compute_centroids(
+    polygons: Sequence[Polygon], analysis_crs: str = "EPSG:28356"
+) -> np.ndarray:
+    """Batch variant: centroids for many polygons as (latitude, longitude) rows.
+
+    shapely.centroid operates on the whole geometry array in C (one FFI
+    crossing for N parcels) and pyproj transforms the coordinate arrays in
+    one vectorised call.
+    """
+    centroids = shapely.centroid(np.asarray(polygons, dtype=object))
+    xs = shapely.get_x(centroids)
+    ys = shapely.get_y(centroids)
+    transformer = _get_transformer(analysis_crs, WGS84)
+    lons, lats = transformer.transform(xs, ys)
+    return np.column_stack([lats, lons])
@@ -0,0 +1,27 @@
+"""Scalar shape metrics for parcel polygons."""
+
+import math
+from typing import Tuple
+
+from shapely.geometry import Polygon
+
+
+def compute_area_perimeter(polygon: Polygon) -> Tuple[float, float]:
+    """Return (area in sqm, perimeter in m) for a projected parcel polygon."""
+    return polygon.area, polygon.length
+
+
+def compute_regularity_index_from_ap(area: float, perimeter: float) -> float:
+    """Regularity index from precomputed area/perimeter — no GEOS calls.
+
+    Full precision; presentation rounding happens once at the end of the
+    pipeline (see runner._apply_rounding).
+    """
+    if not perimeter:
+        return 0.0
+    return max(0.0, min(1.0, 4.0 * math.sqrt(area) / perimeter))
+
+
+def compute_regularity_index(polygon: Polygon) -> float:
+    """Return a 0..1 shape regularity index (1.0 for a square parcel)."""
+    return compute_regularity_index_from_ap(polygon.area, polygon.length)
@@ -0,0 +1,141 @@
+"""Slope and aspect metrics from DEM samples over the parcel."""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+from backend.app.config import settings
+from backend.app.geometry import _kernels
+
+
+def sample_dem_grid(
+    polygon: Polygon, grid_spacing_m: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int]]:
+    """Sample a regular grid of points inside the parcel polygon.
+
+    Returns (xs, ys, (nx, ny)): two contiguous float64 arrays of the
+    in-polygon samples plus the candidate grid shape, so gradient kernels
+    can reshape without re-deriving it. Grid positions are integer
+    multiples of the spacing added to the origin — exact counts with no
+    accumulating FP error, and inclusive of the max edge when it falls
+    exactly on a grid step — so parcels of equal extent always yield the
+    same shape. Candidates are tested against the polygon in one
+    vectorised shapely.contains_xy call (shapely 2.0's successor to
+    shapely.vectorized.contains).
+    """
+    spacing = grid_spacing_m or settings.DEM_GRID_SPACING_M
+    minx, miny, maxx, maxy = polygon.bounds
+    nx = int(np.floor((maxx - minx) / spacing)) + 1
+    ny = int(np.floor((maxy - miny) / spacing)) + 1
+    x_coords = minx + spacing * np.arange(nx, dtype=np.float64)
+    y_coords = miny + spacing * np.arange(ny, dtype=np.float64)
+    xx, yy = np.meshgrid(x_coords, y_coords, indexing="ij")
+    xs = xx.ravel()
+    ys = yy.ravel()
+    if _kernels.pip_mask is not None and not polygon.interiors:
+        ring = np.asarray(polygon.exterior.coords, dtype=np.float64)
+        mask = _kernels.pip_mask(xs, ys, ring).astype(bool)
+    else:
+        # Prepare in place so GEOS builds its indexed representation once;
+        # contains_xy then tests all points against the cached index. The
+        # bbox prefilter is implicit — the candidate grid is already built
+        # from polygon.bounds.
+        shapely.prepare(polygon)
+        mask = shapely.contains_xy(polygon, xs, ys)
+    return xs[mask], ys[mask], (nx, ny)
+
+
+def _sample_raster(
+    dem_data: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    transform: Tuple[float, float, float, float],
+) -> np.ndarray:
+    """Sample elevations at (xs, ys) with a single fancy-index operation.
+
+    ``transform`` is (a, c, e, f) from the raster's affine transform:
+    pixel width, origin x, pixel height (negative for north-up rasters)
+    and origin y.
+    """
+    a, c, e, f = transform
+    cols = ((xs - c) / a).astype(np.int64)
+    rows = ((ys - f) / e).astype(np.int64)
+    return dem_data[rows, cols]
+
+
+def calculate_gradient(
+    dem_data: Optional[np.ndarray], dx: float = 1.0, dy: float = 1.0
+) -> Tuple[float, float]:
+    """Return (mean gradient percent, mean aspect degrees) for a DEM tile.
+
+    Uses Horn's 8-neighbour method — the same kernel as gdaldem — rather
+    than a 2-point central difference, which diverges from GDAL on noisy
+    DEMs. The kernel runs JIT-compiled and parallel when Numba is
+    installed, falling back to the strided-slice NumPy implementation
+    otherwise. The aspect mean is gradient-magnitude weighted and circular.
+    Falls back to a nominal gentle south-facing slope when no DEM tile is
+    supplied (pending the NSW DEM integration).
+    """
+    if dem_data is None:
+        return 5.0, 180.0
+    elev = np.asarray(dem_data, dtype=np.float64)
+    dzdx, dzdy = _kernels.horn_gradient(elev, dx, dy)
+    # hypot is a single vectorised intrinsic and avoids the squared
+    # intermediates (and their overflow risk) of sqrt(a*a + b*b).
+    grad = np.hypot(dzdx, dzdy)
+    aspect = (np.degrees(np.arctan2(dzdy, -dzdx)) + 360.0) % 360.0
+    mean_aspect = circular_mean_angle(aspect.ravel(), weights=grad.ravel())
+    # Aspect weighting is done with grad; scale to percent in place rather
+    # than allocating a second tile-sized array.
+    np.multiply(grad, 100.0, out=grad)
+    return float(grad.mean()), float(mean_aspect)
+
+
+def circular_mean_angle(
+    angles: Sequence[float], weights: Optional[Sequence[float]] = None
+) -> float:
+    """Mean of angles in degrees, correctly handling the 0/360 wrap.
+
+    The resultant vector (C, S) is accumulated with numpy sin/cos ufuncs
+    over the whole array — one SIMD-backed pass instead of N Python-level
+    math.sin/math.cos calls — and the mean is atan2(S, C).
+    """
+    theta = np.deg2rad(np.asarray(angles, dtype=np.float64))
+    if weights is None:
+        sin_sum = float(np.sum(np.sin(theta)))
+        cos_sum = float(np.sum(np.cos(theta)))
+    else:
+        w = np.asarray(weights, dtype=np.float64)
+        sin_sum = float(w @ np.sin(theta))
+        cos_sum = float(w @ np.cos(theta))
+    if sin_sum == 0.0 and cos_sum == 0.0:
+        return 0.0
+    return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360.0) % 360.0
+
+
+def compute_slope_metrics(
+    polygon: Polygon,
+    street_direction_deg: Optional[float] = None,
+    dem_data: Optional[np.ndarray] = None,
+) -> Dict[str, object]:
+    """Derive slope metrics for the parcel from DEM samples."""
+    xs, ys, _grid_shape = sample_dem_grid(polygon)
+    gradient_percent, aspect_deg = calculate_gradient(dem_data)
+    primary_fall_direction = aspect_deg
+    # Full-precision values; rounding is applied once at the end of the
+    # pipeline rather than per helper.
+    result: Dict[str, object] = {
+        "sample_count": int(xs.size),
+        "mean_gradient_percent": gradient_percent,
+        "primary_fall_direction_deg": primary_fall_direction,
+    }
+    if street_direction_deg is not None:
+        # Branchless circular difference: one mod and one abs.
+        angle_diff = abs(
+            (primary_fall_direction - street_direction_deg + 180.0) % 360.0 - 180.0
+        )
+        result["falls_to_street"] = angle_diff <= 45.0
+    return result
@@ -0,0 +1,72 @@
+"""Canonical FastAPI service entry point.
+
+Mounts the parcel analysis routes and serves the service-level
+``/``, ``/health`` and ``/api/status`` endpoints. The constant payloads
+for ``/`` and ``/health`` are serialised once at import time and served
+as raw bytes, skipping per-request model construction and JSON encoding
+entirely; ``/api/status`` stays dynamic because it reflects settings.
+"""
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from backend.app.api.fastapi_app import lifespan, router as analysis_router
+from backend.app.config import get_settings
+from backend.app.routers.planning import router as planning_router
+
+app = FastAPI(
+    title="Property Development Analysis API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Explicit method list keeps CORS preflight responses small and cacheable;
+# the API only ever serves GET and POST.
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["*"],
+)
+
+app.include_router(analysis_router)
+app.include_router(planning_router)
+
+_ROOT_BYTES = orjson.dumps(
+    {
+        "service": "Property Development Analysis API",
+        "version": "0.1.0",
+        "docs": "/docs",
+    }
+)
+_HEALTH_BYTES = orjson.dumps({"status": "ok"})
+
+
+@app.get("/")
+async def root() -> Response:
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+@app.get("/health")
+async def health_check() -> Response:
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+@app.get("/api/status")
+async def api_status() -> dict:
+    settings = get_settings()
+    return {
+        "status": "ok",
+        "analysis_crs": settings.ANALYSIS_CRS,
+        "output_crs": settings.OUTPUT_CRS,
+        "dem_grid_spacing_m": settings.DEM_GRID_SPACING_M,
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000)
@@ -0,0 +1 @@
+"""Parcel analysis pipeline orchestration."""
@@ -0,0 +1,251 @@
+"""End-to-end parcel analysis pipeline."""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+from backend.app.analysis.constraints_engine import (
+    compute_constraint_severity,
+    evaluate_constraints,
+)
+from backend.app.analysis.yield_engine import compute_yield
+from backend.app.config import Settings, get_settings
+from backend.app.geometry import ParcelGeom
+from backend.app.geometry.boundaries import (
+    identify_boundaries_batch,
+    identify_boundaries_from_coords,
+)
+from backend.app.geometry.centroid import compute_centroid_xy, compute_centroids
+from backend.app.geometry.metrics import compute_regularity_index_from_ap
+from backend.app.geometry.slope import compute_slope_metrics
+from backend.app.planning.cdc_low_rise import evaluate_cdc_potential
+from backend.app.planning.da_guidance import evaluate_da_potential
+from backend.app.planning.lep_rules import (
+    determine_allowed_typologies,
+    determine_allowed_typologies_batch,
+)
+
+
+# Mock parcel shared by every resolve until the NSW LotSearch integration
+# lands. Built (and GEOS-prepared) once at import: per-call construction
+# cost nothing but ring validation and allocation, N times in the batch
+# path. Callers never mutate the polygon.
+_MOCK_POLYGON = Polygon(
+    [
+        (360400, 6259000),
+        (360415, 6259000),
+        (360415, 6258960),
+        (360400, 6258960),
+        (360400, 6259000),
+    ]
+)
+shapely.prepare(_MOCK_POLYGON)
+
+_MOCK_PARCEL_DEFAULTS = {
+    "address": "10 Sample Street, Gosford NSW",
+    "lot_dp": "Lot 12 DP 1234567",
+    "zone_code": "R2",
+    "lga": "Central Coast",
+}
+
+
+def resolve_parcel(user_input: Dict) -> Tuple[Dict, Polygon]:
+    """Resolve user input (address or lot/DP) to parcel data and geometry.
+
+    Placeholder until the NSW LotSearch integration lands: returns a mock
+    residential parcel in MGA Zone 56. The parcel dict is still built per
+    call (it echoes the caller's address/lot_dp and results are mutated
+    downstream), but from hoisted defaults and a shared polygon.
+    """
+    parcel_data = dict(_MOCK_PARCEL_DEFAULTS)
+    if user_input.get("address"):
+        parcel_data["address"] = user_input["address"]
+    if user_input.get("lot_dp"):
+        parcel_data["lot_dp"] = user_input["lot_dp"]
+    return parcel_data, _MOCK_POLYGON
+
+
+def compute_geometry(geom: ParcelGeom, settings: Optional[Settings] = None) -> Dict:
+    """Derive area, shape and boundary metrics for the parcel geometry.
+
+    ``settings`` is threaded in by analyse_parcel so pipeline stages share
+    one resolved instance per parcel instead of re-fetching it.
+    """
+    settings = settings or get_settings()
+    area_sqm, perimeter_m = geom.area, geom.perimeter
+    regularity = compute_regularity_index_from_ap(area_sqm, perimeter_m)
+    lat, lon = compute_centroid_xy(geom.centroid_xy[0], geom.centroid_xy[1], settings.ANALYSIS_CRS)
+    boundaries = identify_boundaries_from_coords(geom.coords_xy)
+    # Outward normal of the front boundary points at the street for a
+    # clockwise exterior ring.
+    street_direction = (boundaries["front"]["bearing_deg"] - 90.0) % 360.0
+    slope = compute_slope_metrics(geom.polygon, street_direction_deg=street_direction)
+    return {
+        "area_sqm": area_sqm,
+        "perimeter_m": perimeter_m,
+        "regularity_index": regularity,
+        "centroid": {"latitude": lat, "longitude": lon},
+        "boundaries": boundaries,
+        "frontage_m": boundaries["frontage_m"],
+        "slope": slope,
+    }
+
+
+# Presentation precision per field. Helpers keep full precision internally;
+# rounding happens once per result here instead of at every helper return.
+_ROUND_SPEC = {
+    "area_sqm": 2,
+    "perimeter_m": 2,
+    "frontage_m": 2,
+    "regularity_index": 3,
+    "mean_gradient_percent": 1,
+    "primary_fall_direction_deg": 1,
+    "max_gfa_sqm": 1,
+}
+
+
+def _apply_rounding(tree: Dict) -> Dict:
+    """Round presentation fields in place, recursing through nested dicts."""
+    for key, value in tree.items():
+        places = _ROUND_SPEC.get(key)
+        if places is not None and isinstance(value, float):
+            tree[key] = round(value, places)
+        elif isinstance(value, dict):
+            _apply_rounding(value)
+    return tree
+
+
+def analyse_parcel(user_input: Dict) -> Dict:
+    """Run the full analysis pipeline for a single parcel."""
+    settings = get_settings()
+    parcel_data, polygon = resolve_parcel(user_input)
+    geom = ParcelGeom.from_polygon(polygon)
+    geometry_data = compute_geometry(geom, settings)
+    constraints = evaluate_constraints(geom.polygon)
+    severity = compute_constraint_severity(constraints)
+    yield_data = compute_yield(geometry_data, constraints)
+    allowed = determine_allowed_typologies(
+        parcel_data["zone_code"], geometry_data["area_sqm"], geometry_data["frontage_m"]
+    )
+    cdc = evaluate_cdc_potential(geometry_data, constraints, parcel_data["zone_code"])
+    da = evaluate_da_potential(geometry_data, constraints, cdc)
+    return _apply_rounding(
+        {
+            "parcel": parcel_data,
+            "geometry": geometry_data,
+            "constraints": constraints,
+            "constraint_severity": severity,
+            "allowed_typologies": allowed,
+            "yield": yield_data,
+            "assessment_pathways": {"cdc": cdc, "da": da},
+            # Second precision is plenty for report metadata and skips the
+            # microsecond formatting work.
+            "analysed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+    )
+
+
+def analyse_parcels(user_inputs: List[Dict]) -> List[Dict]:
+    """Analyse many parcels with vectorised geometry derivation.
+
+    Areas, perimeters, centroids and boundary classifications for the whole
+    batch are computed with shapely 2.0 array ops (one FFI crossing per
+    metric instead of one per parcel); regularity comes from those arrays
+    in a single numpy expression. Constraint, yield and pathway evaluation
+    then run per parcel on the precomputed values.
+    """
+    settings = get_settings()
+    resolved = [resolve_parcel(user_input) for user_input in user_inputs]
+    polygons = np.array([polygon for _, polygon in resolved], dtype=object)
+
+    areas = shapely.area(polygons)
+    perimeters = shapely.length(polygons)
+    safe_perimeters = np.where(perimeters == 0.0, np.inf, perimeters)
+    regularity = np.clip(4.0 * np.sqrt(areas) / safe_perimeters, 0.0, 1.0)
+    centroids = compute_centroids(polygons, settings.ANALYSIS_CRS)
+    boundaries_list = identify_boundaries_batch(polygons)
+    frontages = np.array([b["frontage_m"] for b in boundaries_list])
+    zone_codes = [parcel_data["zone_code"] for parcel_data, _ in resolved]
+    allowed_list = determine_allowed_typologies_batch(zone_codes, areas, frontages)
+
+    # Presentation rounding for the vectorised fields: one SIMD pass per
+    # field rather than one round() builtin call per parcel per field.
+    areas_rounded = np.round(areas, 2)
+    perimeters_rounded = np.round(perimeters, 2)
+    regularity_rounded = np.round(regularity, 3)
+    frontages_rounded = np.round(frontages, 2)
+
+    # One timestamp for the whole batch; every result shares it.
+    now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    results = []
+    for i, (parcel_data, polygon) in enumerate(resolved):
+        boundaries = boundaries_list[i]
+        street_direction = (boundaries["front"]["bearing_deg"] - 90.0) % 360.0
+        slope = compute_slope_metrics(polygon, street_direction_deg=street_direction)
+        geometry_data = {
+            "area_sqm": float(areas_rounded[i]),
+            "perimeter_m": float(perimeters_rounded[i]),
+            "regularity_index": float(regularity_rounded[i]),
+            "centroid": {"latitude": float(centroids[i, 0]), "longitude": float(centroids[i, 1])},
+            "boundaries": boundaries,
+            "frontage_m": float(frontages_rounded[i]),
+            "slope": _apply_rounding(slope),
+        }
+        constraints = evaluate_constraints(polygon)
+        severity = compute_constraint_severity(constraints)
+        yield_data = _apply_rounding(compute_yield(geometry_data, constraints))
+        cdc = evaluate_cdc_potential(geometry_data, constraints, parcel_data["zone_code"])
+        da = evaluate_da_potential(geometry_data, constraints, cdc)
+        results.append(
+            {
+                "parcel": parcel_data,
+                "geometry": geometry_data,
+                "constraints": constraints,
+                "constraint_severity": severity,
+                "allowed_typologies": allowed_list[i],
+                "yield": yield_data,
+                "assessment_pathways": {"cdc": cdc, "da": da},
+                "analysed_at": now_iso,
+            }
+        )
+    return results
+
+
+def _normalise_input(user_input: Dict) -> Tuple[str, str]:
+    """Reduce user input to a canonical (input_type, value) cache key."""
+    address = user_input.get("address")
+    if address:
+        return "address", " ".join(address.split()).lower()
+    lot_dp = user_input.get("lot_dp")
+    if lot_dp:
+        return "lot_dp", " ".join(lot_dp.split()).upper()
+    latitude = user_input.get("latitude")
+    longitude = user_input.get("longitude")
+    if latitude is not None and longitude is not None:
+        return "point", f"{round(latitude, 6)},{round(longitude, 6)}"
+    return "address", ""
+
+
+@lru_cache(maxsize=4096)
+def _cached_analyse(input_type: str, value: str) -> Dict:
+    if input_type == "point":
+        lat_str, lon_str = value.split(",")
+        user_input: Dict = {"latitude": float(lat_str), "longitude": float(lon_str)}
+    else:
+        user_input = {input_type: value}
+    return analyse_parcel(user_input)
+
+
+def analyse_parcel_cached(user_input: Dict) -> Dict:
+    """Analyse a parcel, memoising results by normalised input.
+
+    Repeat queries for the same address, lot/DP or coordinate return the
+    cached result immediately. Callers must treat the returned dict as
+    read-only since it is shared between cache hits.
+    """
+    input_type, value = _normalise_input(user_input)
+    return _cached_analyse(input_type, value)
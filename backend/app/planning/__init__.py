@@ -0,0 +1 @@
+"""Planning pathway assessments (CDC, DA, LEP rules)."""
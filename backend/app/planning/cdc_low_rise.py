@@ -0,0 +1,46 @@
+"""Complying development eligibility under the Low Rise Housing Diversity Code."""
+
+from typing import Dict, List
+
+from backend.app.config import settings
+
+_CDC_ZONES = frozenset({"R1", "R2", "R3", "RU5"})
+
+# (constraint key, blocking message) — complying development is unavailable
+# on land with any of these flags under the SEPP (Exempt and Complying
+# Development Codes). Module-level tuple so each call is one comprehension
+# over static data rather than a re-evaluated if-ladder.
+_CDC_BOOLEAN_BLOCKERS = (
+    ("heritage_item", "Heritage item or heritage conservation area"),
+    ("flood_prone", "Flood control lot"),
+    ("bushfire_prone", "Bushfire prone land (BAL > 40 requires report)"),
+    ("biodiversity_value", "Land identified for biodiversity value"),
+)
+
+
+def evaluate_cdc_potential(
+    geometry_data: Dict, constraints: Dict[str, bool], zone_code: str
+) -> Dict[str, object]:
+    """Assess eligibility for complying development under the Low Rise Code."""
+    blocking: List[str] = [
+        message for key, message in _CDC_BOOLEAN_BLOCKERS if constraints.get(key)
+    ]
+
+    # Numeric thresholds bound to locals once, ahead of any branching.
+    min_area = settings.MIN_LOT_AREA_DUAL_OCC_SQM
+    min_frontage = settings.MIN_FRONTAGE_DUAL_OCC_M
+    max_slope = settings.MAX_SLOPE_CDC_PERCENT
+    area = geometry_data["area_sqm"]
+    frontage = geometry_data["frontage_m"]
+    slope = geometry_data.get("slope", {}).get("mean_gradient_percent", 0.0)
+
+    if zone_code not in _CDC_ZONES:
+        blocking.append(f"Zone {zone_code} is outside the Low Rise Housing Diversity Code")
+    if area < min_area:
+        blocking.append(f"Lot area {area:.0f} sqm below {min_area:.0f} sqm minimum")
+    if frontage < min_frontage:
+        blocking.append(f"Frontage {frontage:.1f} m below {min_frontage:.1f} m minimum")
+    if slope > max_slope:
+        blocking.append(f"Mean slope {slope:.1f}% exceeds {max_slope:.0f}% CDC practical limit")
+
+    return {"cdc_compliant": not blocking, "blocking_constraints": blocking}
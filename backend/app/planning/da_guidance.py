@@ -0,0 +1,50 @@
+"""Development application (DA) pathway guidance."""
+
+from typing import Dict, List
+
+from backend.app.config import settings
+
+# (constraint key, issue message) — static table iterated per call instead
+# of a chain of per-flag if-blocks.
+_DA_BOOLEAN_ISSUES = (
+    ("heritage_item", "Heritage impact statement required"),
+    ("bushfire_prone", "Bushfire assessment (BAL certificate) required"),
+    ("flood_prone", "Flood impact assessment required"),
+    ("geotech_risk", "Geotechnical report required"),
+    ("biodiversity_value", "Biodiversity development assessment may be triggered"),
+)
+
+
+def evaluate_da_potential(
+    geometry_data: Dict, constraints: Dict[str, bool], cdc_result: Dict
+) -> Dict[str, object]:
+    """Summarise the DA pathway where complying development is unavailable."""
+    # Deduplicate at insertion with a seen-set guard instead of a trailing
+    # list(dict.fromkeys(...)) pass, which allocated a dict per call.
+    seen = set()
+    key_issues: List[str] = []
+
+    def _add(issue: str) -> None:
+        if issue not in seen:
+            seen.add(issue)
+            key_issues.append(issue)
+
+    for key, message in _DA_BOOLEAN_ISSUES:
+        if constraints.get(key):
+            _add(message)
+
+    max_slope = settings.MAX_SLOPE_CDC_PERCENT
+    slope = geometry_data.get("slope", {}).get("mean_gradient_percent", 0.0)
+    if slope > max_slope:
+        _add("Steep site: stepped design and retaining works likely")
+    regularity = geometry_data.get("regularity_index", 1.0)
+    if regularity < 0.6:
+        _add("Irregular lot shape constrains building envelope")
+
+    if len(key_issues) > 5:
+        key_issues = key_issues[:5]
+    return {
+        "da_recommended": not cdc_result["cdc_compliant"],
+        "da_supportable": len(key_issues) < 4,
+        "key_issues": key_issues,
+    }
@@ -0,0 +1,125 @@
+"""LEP zoning rules: typology permissibility and development standards."""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.app.config import settings
+
+# Zone memberships hoisted to module-level frozensets — one hash probe per
+# rule instead of a fresh list literal and linear scan on every call.
+_DUAL_OCC_ZONES = frozenset({"R1", "R2", "R3"})
+_MULTI_DWELLING_ZONES = frozenset({"R1", "R3"})
+_TERRACE_ZONES = frozenset({"R1", "R2", "R3"})
+_SECONDARY_DWELLING_ZONES = frozenset({"R1", "R2", "R3", "R5", "RU5"})
+_SINGLE_DWELLING_ZONES = frozenset({"R1", "R2", "R3", "R5", "RU5"})
+
+# (typology, permitted zones, size predicate) — the permissibility logic as
+# a static rule table. The scalar path evaluates it in one comprehension;
+# the batch path reuses the same thresholds as boolean-array ops.
+_TYPOLOGY_RULES = (
+    (
+        "single_dwelling",
+        _SINGLE_DWELLING_ZONES,
+        lambda a, f, s: a >= s.DEFAULT_MIN_LOT_SIZE_SQM,
+    ),
+    (
+        "secondary_dwelling",
+        _SECONDARY_DWELLING_ZONES,
+        lambda a, f, s: a >= s.MIN_LOT_AREA_SECONDARY_DWELLING_SQM,
+    ),
+    (
+        "dual_occupancy",
+        _DUAL_OCC_ZONES,
+        lambda a, f, s: a >= s.MIN_LOT_AREA_DUAL_OCC_SQM
+        and f >= s.MIN_FRONTAGE_DUAL_OCC_M,
+    ),
+    (
+        "terraces",
+        _TERRACE_ZONES,
+        lambda a, f, s: a >= s.MIN_LOT_AREA_TERRACE_SQM
+        and f >= s.MIN_FRONTAGE_TERRACE_M,
+    ),
+    (
+        "multi_dwelling",
+        _MULTI_DWELLING_ZONES,
+        lambda a, f, s: a >= s.MIN_LOT_AREA_MULTI_DWELLING_SQM
+        and f >= s.MIN_FRONTAGE_MULTI_DWELLING_M,
+    ),
+)
+
+
+def determine_allowed_typologies(
+    zone_code: str, area_sqm: float, frontage_m: float
+) -> Dict[str, bool]:
+    """Map each housing typology to whether zone and lot size permit it."""
+    return {
+        name: (zone_code in zones and predicate(area_sqm, frontage_m, settings))
+        for name, zones, predicate in _TYPOLOGY_RULES
+    }
+
+
+def determine_allowed_typologies_batch(
+    zone_codes: Sequence[str],
+    areas: np.ndarray,
+    frontages: np.ndarray,
+) -> List[Dict[str, bool]]:
+    """Vectorised permissibility for a batch of parcels.
+
+    Zone membership and both size thresholds for every rule are evaluated
+    as whole-array boolean ops; the per-parcel dicts are then assembled
+    from the resulting matrix.
+    """
+    zones_arr = np.asarray(zone_codes, dtype=object)
+    flags = {}
+    s = settings
+    thresholds = {
+        "single_dwelling": (s.DEFAULT_MIN_LOT_SIZE_SQM, 0.0),
+        "secondary_dwelling": (s.MIN_LOT_AREA_SECONDARY_DWELLING_SQM, 0.0),
+        "dual_occupancy": (s.MIN_LOT_AREA_DUAL_OCC_SQM, s.MIN_FRONTAGE_DUAL_OCC_M),
+        "terraces": (s.MIN_LOT_AREA_TERRACE_SQM, s.MIN_FRONTAGE_TERRACE_M),
+        "multi_dwelling": (
+            s.MIN_LOT_AREA_MULTI_DWELLING_SQM,
+            s.MIN_FRONTAGE_MULTI_DWELLING_M,
+        ),
+    }
+    for name, zones, _predicate in _TYPOLOGY_RULES:
+        min_area, min_frontage = thresholds[name]
+        allowed = np.isin(zones_arr, list(zones)) & (areas >= min_area)
+        if min_frontage > 0.0:
+            allowed &= frontages >= min_frontage
+        flags[name] = allowed
+    return [
+        {name: bool(flags[name][i]) for name, _zones, _p in _TYPOLOGY_RULES}
+        for i in range(len(zones_arr))
+    ]
+
+
+# Default controls resolved from settings once; the no-override call — by
+# far the common case until per-LGA LEP data lands — just copies it.
+_DEFAULT_LEP_CONTROLS = {
+    "fsr": settings.DEFAULT_FSR,
+    "height_limit_m": settings.DEFAULT_HEIGHT_LIMIT_M,
+    "min_lot_size_sqm": settings.DEFAULT_MIN_LOT_SIZE_SQM,
+}
+
+
+def evaluate_lep_controls(
+    zone_code: str, lep_controls: Optional[Dict] = None
+) -> Dict[str, float]:
+    """Resolve FSR, height and minimum lot size, falling back to defaults."""
+    if not lep_controls:
+        return dict(_DEFAULT_LEP_CONTROLS)
+    return {
+        key: lep_controls.get(key, default)
+        for key, default in _DEFAULT_LEP_CONTROLS.items()
+    }
+
+
+def calculate_setbacks() -> Dict[str, float]:
+    """Standard setbacks from settings (front, rear, both sides)."""
+    return {
+        "front_m": settings.FRONT_SETBACK_M,
+        "rear_m": settings.REAR_SETBACK_M,
+        "side_m": settings.SIDE_SETBACK_M,
+    }
@@ -0,0 +1 @@
+"""FastAPI routers grouped by domain."""
@@ -0,0 +1,133 @@
+"""Planning data endpoints backed by the NSW services."""
+
+from typing import Any, Dict, List, Optional
+
+import orjson
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from backend.app.services.lec import (
+    _CLAUSE_46_NOTE,
+    _COMMON_VARIATIONS,
+    _PLACEHOLDER_FINDING,
+    lec_service,
+)
+from backend.app.services.nsw_planning import nsw_planning_service
+
+# orjson on the way out too, so the router serialises identically whether
+# mounted under main (orjson default) or a bare FastAPI app.
+router = APIRouter(
+    prefix="/api/planning", tags=["planning"], default_response_class=ORJSONResponse
+)
+
+# Australian bounding box: rejects (0, 0), bot probes and swapped
+# coordinates at the validator layer, before any upstream round-trip.
+_LATITUDE = Query(..., ge=-44.0, le=-10.0)
+_LONGITUDE = Query(..., ge=112.0, le=154.0)
+_RADIUS_KM = Query(5.0, gt=0.0, le=50.0)
+
+
+# extra='ignore' lets the compiled validators drop unexpected service
+# fields instead of erroring, keeping the pass-through validation cheap;
+# frozen=True marks the instances immutable and hashable, so they can key
+# caches and Pydantic can skip mutation bookkeeping.
+class ZoningResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    zone_code: Optional[str] = None
+    zone_name: Optional[str] = None
+    epi_name: Optional[str] = None
+    lga: Optional[str] = None
+    source: str
+
+
+class PlanningControlsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    fsr: Optional[float] = None
+    height_limit_m: Optional[float] = None
+    min_lot_size_sqm: Optional[float] = None
+    source: str
+
+
+class LECFinding(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    case_name: str
+    citation: str
+    summary: Optional[str] = None
+
+
+class LECPrecedentsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    findings: List[LECFinding]
+    common_variations: List[str] = []
+    note: str
+
+
+@router.get("/zoning", response_model=ZoningResponse, response_model_exclude_unset=True)
+async def get_zoning(
+    latitude: float = _LATITUDE, longitude: float = _LONGITUDE
+) -> Dict[str, Any]:
+    return await nsw_planning_service.fetch_land_zoning(latitude, longitude)
+
+
+@router.get(
+    "/controls",
+    response_model=PlanningControlsResponse,
+    response_model_exclude_unset=True,
+)
+async def get_controls(
+    latitude: float = _LATITUDE, longitude: float = _LONGITUDE
+) -> Dict[str, Any]:
+    return await nsw_planning_service.fetch_planning_controls(latitude, longitude)
+
+
+# Validator and serialiser for the precedents payload, compiled once at
+# import. Calling the adapter directly skips FastAPI's generic response-
+# model resolution layer on every request; the route therefore carries no
+# response_model and documents its shape via the openapi example below.
+_LEC_ADAPTER: TypeAdapter = TypeAdapter(LECPrecedentsResponse)
+
+_LEC_RESPONSES = {
+    200: {
+        "content": {
+            "application/json": {
+                "example": {
+                    "findings": [_PLACEHOLDER_FINDING],
+                    "common_variations": list(_COMMON_VARIATIONS),
+                    "note": _CLAUSE_46_NOTE,
+                }
+            }
+        }
+    }
+}
+
+# The LEC response is location-independent until the Caselaw integration
+# lands, so the default-radius path serves bytes serialised once at import
+# — no Pydantic validation, no per-request JSON encoding. Remove the
+# shortcut when real findings arrive.
+_LEC_PLACEHOLDER_BYTES = orjson.dumps(
+    {
+        "findings": [_PLACEHOLDER_FINDING],
+        "common_variations": list(_COMMON_VARIATIONS),
+        "note": _CLAUSE_46_NOTE,
+    }
+)
+
+
+@router.get("/lec-findings", response_model=None, responses=_LEC_RESPONSES)
+async def get_lec_findings(
+    latitude: float = _LATITUDE,
+    longitude: float = _LONGITUDE,
+    radius_km: float = _RADIUS_KM,
+) -> Response:
+    if radius_km == 5.0:
+        return Response(content=_LEC_PLACEHOLDER_BYTES, media_type="application/json")
+    precedents = await lec_service.get_clause_46_precedents(latitude, longitude, radius_km)
+    return Response(
+        content=_LEC_ADAPTER.dump_json(_LEC_ADAPTER.validate_python(precedents)),
+        media_type="application/json",
+    )
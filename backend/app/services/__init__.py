@@ -0,0 +1 @@
+"""External data-source clients (NSW Planning Portal, NSW Caselaw)."""
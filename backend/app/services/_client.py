@@ -0,0 +1,40 @@
+"""Shared httpx.AsyncClient for outbound service calls.
+
+A single process-wide client keeps TCP connections and TLS sessions to
+the ArcGIS and Caselaw hosts alive between requests; per-call client
+construction would pay a fresh connect + handshake (~100-300 ms WAN) on
+every proxied request. Created lazily so importing a service never opens
+sockets; closed from the FastAPI lifespan handler on shutdown.
+"""
+
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None:
+        # HTTP/2 lets the gathered layer queries multiplex over one
+        # TCP+TLS connection instead of opening one per layer.
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared client (lifespan shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,215 @@
+"""Client for NSW Land and Environment Court caselaw lookups."""
+
+import asyncio
+import logging
+import os
+import time
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+from cachetools import TTLCache
+
+from backend.app.services._client import get_client
+
+try:
+    import redis.asyncio as redis_asyncio
+
+    HAVE_REDIS = True
+except ImportError:  # pragma: no cover - exercised only without redis
+    redis_asyncio = None
+    HAVE_REDIS = False
+
+try:
+    import h3
+
+    HAVE_H3 = True
+except ImportError:  # pragma: no cover - exercised only without h3
+    h3 = None
+    HAVE_H3 = False
+
+logger = logging.getLogger(__name__)
+
+# Precedent results stay valid for days; cache a full day per cell+radius.
+_CACHE_TTL_SECONDS = 86400
+
+# Cap on concurrent per-case detail fetches: enough to overlap the Caselaw
+# RTTs without tripping its rate limits.
+_CASE_FETCH_CONCURRENCY = 8
+
+# Static response pieces hoisted to module scope — building these per call
+# allocated a list, a long string and a dict per request for no reason.
+_COMMON_VARIATIONS = (
+    "Height of Buildings (60%)",
+    "Floor Space Ratio (30%)",
+    "Setbacks (10%)",
+)
+_CLAUSE_46_NOTE = (
+    "Clause 4.6 precedent search is indicative only; "
+    "verify against NSW Caselaw before relying on it."
+)
+# Date windows for caselaw searches only need minute resolution; memoising
+# "now" per minute skips a syscall and datetime construction per request
+# and keeps derived cache keys stable within the minute.
+_TODAY_CACHE: Tuple[float, Optional[datetime]] = (-1.0, None)
+
+
+def _today_minute() -> datetime:
+    global _TODAY_CACHE
+    minute = time.monotonic() // 60
+    cached_minute, cached_now = _TODAY_CACHE
+    if cached_now is None or minute != cached_minute:
+        cached_now = datetime.now()
+        _TODAY_CACHE = (minute, cached_now)
+    return cached_now
+
+
+_PLACEHOLDER_FINDING = {
+    "case_name": "Indicative clause 4.6 variation pattern",
+    "citation": "placeholder",
+    "summary": (
+        "Live NSW Caselaw results pending; local variations most commonly "
+        "concern height, FSR and setbacks."
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _build_findings(
+    lat_r: float, lon_r: float, radius_km: float, years_back: int
+) -> List[Dict]:
+    """Findings list for a coarse (rounded) query key.
+
+    Today this only wraps the placeholder, but repeat calls for the same
+    ~1 km cell already share one list object instead of rebuilding it;
+    once results vary by location, swap the decorator for an async-aware
+    cache and keep the same key shape. Returned lists are shared — never
+    mutate them.
+    """
+    return [_PLACEHOLDER_FINDING]
+
+
+class LECService:
+    """Surfaces LEC findings relevant to a development site.
+
+    Placeholder until the NSW Caselaw API integration lands; real
+    searches will go through the shared AsyncClient in _client.py.
+
+    Assembled precedent responses are cached by spatial cell and radius:
+    in Redis when a ``REDIS_URL`` is configured and the redis package is
+    installed (shared across workers), otherwise in a per-process
+    TTLCache. Cell keys use H3 resolution 8 (~460 m) when h3 is
+    available, falling back to coordinates rounded to 3 decimal places
+    (~110 m) so near-identical queries still collapse to one entry.
+    """
+
+    # Invariant per class, not per instance — matches NSWPlanningService.
+    CASELAW_API: ClassVar[str] = "https://api.caselaw.nsw.gov.au"
+    _TIMEOUT: ClassVar[httpx.Timeout] = httpx.Timeout(10.0, connect=5.0)
+
+    def __init__(self) -> None:
+        # Flipped on once the Caselaw integration is verified; keeps the
+        # live search path exercised in tests without hitting the API.
+        self._live = bool(os.environ.get("CASELAW_API_ENABLED"))
+        self._local_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CACHE_TTL_SECONDS)
+        self._redis = None
+        redis_url = os.environ.get("REDIS_URL")
+        if redis_url and HAVE_REDIS:
+            self._redis = redis_asyncio.from_url(redis_url)
+
+    @staticmethod
+    def _cell_key(latitude: float, longitude: float, radius_km: float) -> str:
+        if HAVE_H3:
+            cell = h3.latlng_to_cell(latitude, longitude, 8)
+        else:
+            cell = f"{round(latitude, 3)},{round(longitude, 3)}"
+        return f"lec:{cell}:{radius_km}"
+
+    async def _cache_get(self, key: str) -> Optional[Dict]:
+        if self._redis is not None:
+            try:
+                cached = await self._redis.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except Exception:  # pragma: no cover - redis outage path
+                logger.warning("LEC cache read failed; falling through", exc_info=True)
+        return self._local_cache.get(key)
+
+    async def _cache_set(self, key: str, result: Dict) -> None:
+        self._local_cache[key] = result
+        if self._redis is not None:
+            try:
+                await self._redis.setex(key, _CACHE_TTL_SECONDS, orjson.dumps(result))
+            except Exception:  # pragma: no cover - redis outage path
+                logger.warning("LEC cache write failed", exc_info=True)
+
+    async def search_lec_findings(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float = 5.0,
+        years_back: int = 10,
+    ) -> List[Dict]:
+        """Findings from LEC matters near the point.
+
+        One search request identifies matching cases, then per-case
+        details are fetched concurrently under a bounded semaphore —
+        latency is O(search + slowest case) rather than O(search + sum of
+        cases). Until CASELAW_API_ENABLED is set the shared placeholder
+        finding is returned; callers must not mutate it.
+        """
+        if not self._live:
+            return _build_findings(
+                round(latitude, 2), round(longitude, 2), radius_km, years_back
+            )
+        end_date = _today_minute()
+        start_date = end_date - timedelta(days=years_back * 365)
+        response = await get_client().get(
+            f"{self.CASELAW_API}/search",
+            timeout=self._TIMEOUT,
+            params={
+                "latitude": latitude,
+                "longitude": longitude,
+                "radius_km": radius_km,
+                "start_date": start_date.date().isoformat(),
+                "end_date": end_date.date().isoformat(),
+            },
+        )
+        response.raise_for_status()
+        case_ids = [case["id"] for case in orjson.loads(response.content)["results"]]
+        semaphore = asyncio.Semaphore(_CASE_FETCH_CONCURRENCY)
+        return list(
+            await asyncio.gather(
+                *(self._fetch_case(semaphore, case_id) for case_id in case_ids)
+            )
+        )
+
+    async def _fetch_case(self, semaphore: asyncio.Semaphore, case_id: str) -> Dict:
+        async with semaphore:
+            response = await get_client().get(
+                f"{self.CASELAW_API}/case/{case_id}", timeout=self._TIMEOUT
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+    async def get_clause_46_precedents(
+        self, latitude: float, longitude: float, radius_km: float = 5.0
+    ) -> Dict:
+        """Clause 4.6 variation precedents near the point, cached by cell."""
+        key = self._cell_key(latitude, longitude, radius_km)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+        findings = await self.search_lec_findings(latitude, longitude, radius_km)
+        result = {
+            "findings": findings,
+            "common_variations": list(_COMMON_VARIATIONS),
+            "note": _CLAUSE_46_NOTE,
+        }
+        await self._cache_set(key, result)
+        return result
+
+
+lec_service = LECService()
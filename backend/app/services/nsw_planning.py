@@ -0,0 +1,190 @@
+"""Client for NSW Planning Portal ArcGIS spatial services."""
+
+import asyncio
+from typing import ClassVar, Dict, Optional, Tuple
+
+import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
+
+from backend.app.config import settings
+from backend.app.services._client import get_client
+
+# Constant portions of the ArcGIS point-query params, built once. Per call
+# only the geometry (and for layer queries the field list) is substituted,
+# trimming a handful of string/dict allocations on the zoning hot path.
+_POINT_QUERY_PARAMS_STATIC = {
+    "geometryType": "esriGeometryPoint",
+    "inSR": "4326",
+    "spatialRel": "esriSpatialRelIntersects",
+    "returnGeometry": "false",
+    # Only features[0].attributes is read, so cap the result set and
+    # strip everything else the server would otherwise send.
+    "resultRecordCount": "1",
+    "returnExceededLimitFeatures": "false",
+    "geometryPrecision": "0",
+    "f": "json",
+}
+_ZONING_PARAMS_STATIC = _POINT_QUERY_PARAMS_STATIC | {
+    "outFields": "SYM_CODE,LAY_CLASS,EPI_NAME,LGA_NAME",
+}
+
+
+class NSWPlanningService:
+    """Queries the NSW EPI primary planning layers (zoning, controls).
+
+    All calls go through the shared module-level AsyncClient so repeated
+    lookups reuse the pooled connection to the ArcGIS host instead of
+    paying a TCP connect and TLS handshake per request.
+    """
+
+    # Endpoints and the timeout are invariant, so they live at class scope:
+    # the strings are interned once and the Timeout object is never rebuilt,
+    # even if the service is ever (wrongly) instantiated per request.
+    _BASE: ClassVar[str] = (
+        "https://mapprod3.environment.nsw.gov.au/arcgis/rest/services/"
+        "Planning/EPI_Primary_Planning_Layers/MapServer"
+    )
+    LAND_ZONING_ENDPOINT: ClassVar[str] = f"{_BASE}/2/query"
+    FSR_ENDPOINT: ClassVar[str] = f"{_BASE}/1/query"
+    HOB_ENDPOINT: ClassVar[str] = f"{_BASE}/5/query"
+    LOT_SIZE_ENDPOINT: ClassVar[str] = f"{_BASE}/4/query"
+    _TIMEOUT: ClassVar[httpx.Timeout] = httpx.Timeout(10.0, connect=5.0)
+
+    def __init__(self) -> None:
+        # Zoning is effectively immutable over hours; caching by
+        # ~11 m-rounded coordinate turns repeat UI loads of the same
+        # parcel into dict lookups instead of ArcGIS round-trips.
+        self._zoning_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+        # Single-flight map: concurrent misses on the same key await one
+        # in-flight fetch instead of stampeding the upstream. Unlike the
+        # coarse lock it replaced, misses on different keys stay parallel.
+        self._inflight: Dict[Tuple[float, float], "asyncio.Future[Dict]"] = {}
+
+    @staticmethod
+    def _zoning_key(latitude: float, longitude: float) -> Tuple[float, float]:
+        return (round(latitude, 4), round(longitude, 4))
+
+    async def fetch_land_zoning(self, latitude: float, longitude: float) -> Dict:
+        """Zone code and instrument for the point, from the Land Zoning layer."""
+        key = self._zoning_key(latitude, longitude)
+        cached = self._zoning_cache.get(key)
+        if cached is not None:
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+        future: "asyncio.Future[Dict]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch_land_zoning_uncached(latitude, longitude)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            # Don't poison an hour of lookups with a transient failure.
+            if result.get("source") != "unavailable":
+                self._zoning_cache[key] = result
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_land_zoning_uncached(self, latitude: float, longitude: float) -> Dict:
+        params = _ZONING_PARAMS_STATIC | {"geometry": f"{longitude},{latitude}"}
+        try:
+            response = await get_client().get(
+                self.LAND_ZONING_ENDPOINT, params=params, timeout=self._TIMEOUT
+            )
+            response.raise_for_status()
+            # orjson is several times faster than response.json()'s stdlib
+            # decoder on the multi-KB ArcGIS payloads.
+            payload = orjson.loads(response.content)
+        except httpx.HTTPError:
+            return {"zone_code": None, "source": "unavailable"}
+        features = payload.get("features") or []
+        if not features:
+            return {"zone_code": None, "source": "nsw_planning_portal"}
+        attributes = features[0].get("attributes", {})
+        return {
+            "zone_code": attributes.get("SYM_CODE"),
+            "zone_name": attributes.get("LAY_CLASS"),
+            "epi_name": attributes.get("EPI_NAME"),
+            "lga": attributes.get("LGA_NAME"),
+            "source": "nsw_planning_portal",
+        }
+
+    async def _query_layer_value(
+        self, endpoint: str, field: str, latitude: float, longitude: float
+    ) -> Optional[float]:
+        """Numeric attribute of the feature at the point, or None.
+
+        Control layers can return many overlapping features with bulky
+        metadata; only the first attributes dict matters, so the response
+        is streamed through ijson and the connection dropped as soon as
+        that dict has parsed — the collection is never materialised. The
+        zoning fetch keeps its orjson full parse: with resultRecordCount=1
+        the body is tiny and one decode beats streaming overhead.
+        """
+        params = _POINT_QUERY_PARAMS_STATIC | {
+            "geometry": f"{longitude},{latitude}",
+            "outFields": field,
+        }
+        attributes = ijson.sendable_list()
+        parser = ijson.items_coro(attributes, "features.item.attributes")
+        async with get_client().stream(
+            "GET", endpoint, params=params, timeout=self._TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                try:
+                    parser.send(chunk)
+                except StopIteration:
+                    break
+                if attributes:
+                    break
+        if not attributes:
+            return None
+        value = attributes[0].get(field)
+        return float(value) if value is not None else None
+
+    async def _fetch_fsr(self, latitude: float, longitude: float) -> Optional[float]:
+        return await self._query_layer_value(self.FSR_ENDPOINT, "FSR", latitude, longitude)
+
+    async def _fetch_hob(self, latitude: float, longitude: float) -> Optional[float]:
+        return await self._query_layer_value(self.HOB_ENDPOINT, "MAX_B_H", latitude, longitude)
+
+    async def _fetch_min_lot(self, latitude: float, longitude: float) -> Optional[float]:
+        return await self._query_layer_value(self.LOT_SIZE_ENDPOINT, "LOT_SIZE", latitude, longitude)
+
+    async def fetch_planning_controls(self, latitude: float, longitude: float) -> Dict:
+        """FSR, height of building and minimum lot size for the point.
+
+        The three layer queries are independent, so they run concurrently
+        on the shared client — wall clock is one upstream round-trip, not
+        three. A failed or empty layer falls back to the configured
+        default rather than failing the whole response.
+        """
+        fsr, hob, min_lot = await asyncio.gather(
+            self._fetch_fsr(latitude, longitude),
+            self._fetch_hob(latitude, longitude),
+            self._fetch_min_lot(latitude, longitude),
+            return_exceptions=True,
+        )
+        fetched = not any(
+            isinstance(value, BaseException) for value in (fsr, hob, min_lot)
+        )
+        return {
+            "fsr": fsr if isinstance(fsr, float) else settings.DEFAULT_FSR,
+            "height_limit_m": (
+                hob if isinstance(hob, float) else settings.DEFAULT_HEIGHT_LIMIT_M
+            ),
+            "min_lot_size_sqm": (
+                min_lot if isinstance(min_lot, float) else settings.DEFAULT_MIN_LOT_SIZE_SQM
+            ),
+            "source": "nsw_planning_portal" if fetched else "partial",
+        }
+
+
+nsw_planning_service = NSWPlanningService()
@@ -0,0 +1,8 @@
+#!/bin/sh
+# Build the optional point-in-polygon C extension next to its source.
+# Run once at image build time; the app works without it (shapely
+# fallback) and picks the library up automatically when present.
+set -e
+dir="$(dirname "$0")/../app/geometry"
+cc -O3 -shared -fPIC -o "$dir/_pip_c.so" "$dir/_pip_c.c"
+echo "built $dir/_pip_c.so"
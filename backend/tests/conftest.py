@@ -0,0 +1,19 @@
+"""Shared fixtures for the backend test suite."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and one app lifespan) for the whole suite.
+
+    Constructing TestClient per test module re-runs startup — overlay
+    index warm-up and the lifespan context — once per file. Session scope
+    amortises it across the suite and guarantees the shared outbound HTTP
+    client is opened and closed exactly once.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
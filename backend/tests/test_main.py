@@ -0,0 +1,25 @@
+"""Tests for the service-level endpoints."""
+
+
+def test_root(client):
+    payload = client.get("/").json()
+    assert payload["service"] == "Property Development Analysis API"
+
+
+def test_health(client):
+    assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_api_status_reflects_settings(client):
+    payload = client.get("/api/status").json()
+    assert payload["status"] == "ok"
+    assert payload["analysis_crs"] == "EPSG:28356"
+
+
+def test_analyse_parcel(client):
+    response = client.post("/analyse_parcel", json={"address": "10 Sample St"})
+    assert response.status_code == 200
+    result = response.json()["result"]
+    # The cache layer normalises addresses (whitespace folded, lowercased).
+    assert result["parcel"]["address"] == "10 sample st"
+    assert result["geometry"]["area_sqm"] == 600.0
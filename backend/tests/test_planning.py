@@ -0,0 +1,27 @@
+"""Tests for the /api/planning routes (no live NSW calls)."""
+
+import httpx
+
+from backend.app.services.nsw_planning import nsw_planning_service
+
+
+def test_controls_fall_back_to_defaults(client, monkeypatch):
+    async def unavailable(endpoint, field, latitude, longitude):
+        raise httpx.ConnectError("layer down")
+
+    monkeypatch.setattr(nsw_planning_service, "_query_layer_value", unavailable)
+    payload = client.get(
+        "/api/planning/controls", params={"latitude": -33.43, "longitude": 151.34}
+    ).json()
+    assert payload["source"] == "partial"
+    assert payload["fsr"] == 0.5
+    assert payload["height_limit_m"] == 8.5
+
+
+def test_lec_findings_placeholder(client):
+    payload = client.get(
+        "/api/planning/lec-findings", params={"latitude": -33.43, "longitude": 151.34}
+    ).json()
+    assert payload["findings"][0]["citation"] == "placeholder"
+    assert payload["common_variations"][0].startswith("Height")
+    assert "Caselaw" in payload["note"]
@@ -0,0 +1,28 @@
+"""Tests for slope metrics, focused on circular-angle wraparound."""
+
+from shapely.geometry import Polygon
+
+from backend.app.geometry.slope import circular_mean_angle, compute_slope_metrics
+
+PARCEL = Polygon(
+    [(360400, 6259000), (360415, 6259000), (360415, 6258960), (360400, 6258960)]
+)
+
+
+def test_falls_to_street_within_tolerance():
+    # Stubbed fall direction is 180 deg; street to the south.
+    metrics = compute_slope_metrics(PARCEL, street_direction_deg=180.0)
+    assert metrics["falls_to_street"] is True
+
+
+def test_falls_to_street_wraparound():
+    # 180 vs 350 differs by 170 deg, not 190: must not fall to street.
+    metrics = compute_slope_metrics(PARCEL, street_direction_deg=350.0)
+    assert metrics["falls_to_street"] is False
+    # 180 vs 145 differs by 35 deg: falls to street.
+    metrics = compute_slope_metrics(PARCEL, street_direction_deg=145.0)
+    assert metrics["falls_to_street"] is True
+
+
+def test_circular_mean_wraps_through_north():
+    assert abs(circular_mean_angle([350.0, 10.0]) - 0.0) < 1e-9